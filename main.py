@@ -1,15 +1,242 @@
 import random
-import noise
-import math
 import json
 import os
+import pickle
+import bisect
+import numpy as np
 from PIL import Image  # For procedural texture generation
 from ursina import *
 from ursina.prefabs.first_person_controller import FirstPersonController
 from ursina.shaders import basic_lighting_shader
 
-# Leaderboard file path
+# Leaderboard file path (small and human-readable, so it stays JSON)
 LEADERBOARD_FILE = "leaderboard.json"
+# Savegame file path (binary - saved every auto-save interval, and pickle
+# skips the float-to-string formatting that dominates json.dump)
+SAVEGAME_FILE = "savegame.pkl"
+
+# Permutation table for the vectorized Perlin noise (shuffled once, fixed seed
+# so textures stay reproducible). Doubled so perm[perm[i] + j] never overflows.
+_PERLIN_PERM = np.arange(256, dtype=np.int32)
+np.random.RandomState(42).shuffle(_PERLIN_PERM)
+_PERLIN_PERM = np.concatenate([_PERLIN_PERM, _PERLIN_PERM])
+
+def _perlin_gradient(h, x, y):
+    """Gradient dot product for hash values, vectorized over arrays"""
+    u = np.where(h & 1, -x, x)
+    v = np.where(h & 2, -y, y)
+    return u + v
+
+def _perlin2d(x, y):
+    """Vectorized 2D Perlin noise over coordinate arrays, roughly in [-1, 1]"""
+    xi = np.floor(x).astype(np.int32)
+    yi = np.floor(y).astype(np.int32)
+    xf = (x - xi).astype(np.float32)
+    yf = (y - yi).astype(np.float32)
+    xi &= 255
+    yi &= 255
+
+    # Smoothstep fade 3t^2 - 2t^3
+    u = xf * xf * (3.0 - 2.0 * xf)
+    v = yf * yf * (3.0 - 2.0 * yf)
+
+    # Hash the four cell corners through the permutation table
+    perm = _PERLIN_PERM
+    aa = perm[perm[xi] + yi]
+    ab = perm[perm[xi] + yi + 1]
+    ba = perm[perm[xi + 1] + yi]
+    bb = perm[perm[xi + 1] + yi + 1]
+
+    # Interpolate the corner gradients
+    x1 = _perlin_gradient(aa, xf, yf) + u * (_perlin_gradient(ba, xf - 1, yf) - _perlin_gradient(aa, xf, yf))
+    x2 = _perlin_gradient(ab, xf, yf - 1) + u * (_perlin_gradient(bb, xf - 1, yf - 1) - _perlin_gradient(ab, xf, yf - 1))
+    return x1 + v * (x2 - x1)
+
+def _perlin_grid_numpy(size, scale, octaves, persistence):
+    """Generate a size x size grid of fractal Perlin noise in one vectorized pass"""
+    ys, xs = np.mgrid[0:size, 0:size].astype(np.float32) / scale
+    total = np.zeros((size, size), dtype=np.float32)
+    amplitude = 1.0
+    frequency = 1.0
+    for _ in range(octaves):
+        total += amplitude * _perlin2d(xs * frequency, ys * frequency)
+        amplitude *= persistence
+        frequency *= 2.0
+    return total
+
+# Optionally JIT-compile the Perlin kernel with Numba: the scalar loop gets
+# compiled to parallel native code and the rows are split across cores.
+# The vectorized NumPy path stays as the fallback when numba isn't installed.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _perlin_grid_jit(size, scale, octaves, persistence, perm):
+        out = np.empty((size, size), dtype=np.float32)
+        for y in prange(size):
+            for x in range(size):
+                total = np.float32(0.0)
+                amplitude = 1.0
+                frequency = 1.0
+                for _ in range(octaves):
+                    px = x / scale * frequency
+                    py = y / scale * frequency
+                    xi = int(np.floor(px))
+                    yi = int(np.floor(py))
+                    xf = px - xi
+                    yf = py - yi
+                    xi &= 255
+                    yi &= 255
+                    # Smoothstep fade 3t^2 - 2t^3
+                    u = xf * xf * (3.0 - 2.0 * xf)
+                    v = yf * yf * (3.0 - 2.0 * yf)
+                    aa = perm[perm[xi] + yi]
+                    ab = perm[perm[xi] + yi + 1]
+                    ba = perm[perm[xi + 1] + yi]
+                    bb = perm[perm[xi + 1] + yi + 1]
+                    # Inlined gradient dot products (same as _perlin_gradient)
+                    g_aa = (-xf if aa & 1 else xf) + (-yf if aa & 2 else yf)
+                    g_ba = (-(xf - 1) if ba & 1 else xf - 1) + (-yf if ba & 2 else yf)
+                    g_ab = (-xf if ab & 1 else xf) + (-(yf - 1) if ab & 2 else yf - 1)
+                    g_bb = (-(xf - 1) if bb & 1 else xf - 1) + (-(yf - 1) if bb & 2 else yf - 1)
+                    x1 = g_aa + u * (g_ba - g_aa)
+                    x2 = g_ab + u * (g_bb - g_ab)
+                    total += amplitude * (x1 + v * (x2 - x1))
+                    amplitude *= persistence
+                    frequency *= 2.0
+                out[y, x] = total
+        return out
+
+def _perlin_grid(size, scale, octaves=1, persistence=0.5):
+    """Generate a size x size grid of fractal Perlin noise, JIT-compiled
+    when numba is available, vectorized NumPy otherwise"""
+    if njit is not None:
+        return _perlin_grid_jit(size, float(scale), octaves, persistence, _PERLIN_PERM)
+    return _perlin_grid_numpy(size, scale, octaves, persistence)
+
+# Seed-independent noise grids cached per (size, scale) and shared across
+# every texture that needs one (e.g. all car colors)
+_noise_grid_cache = {}
+
+def _cached_noise_grid(size, scale):
+    key = (size, scale)
+    if key not in _noise_grid_cache:
+        _noise_grid_cache[key] = _perlin_grid(size, scale)
+    return _noise_grid_cache[key]
+
+def _ground_kernel():
+    """Asphalt: dark gray with Perlin variation. 256 is plenty for a tiled
+    noise texture (texture_scale repeats it); one octave is enough since
+    extra octaves were invisible in a low-amplitude grayscale wobble"""
+    size = 256
+    n = _perlin_grid(size, scale=100)
+    gray = (50 + n * 30).astype(np.uint8)
+    return np.repeat(gray[..., None], 3, axis=2)
+
+def _wall_kernel():
+    """Red and white stripes - the pattern only depends on the row, so a
+    1-D stripe mask is broadcast across the image"""
+    size = 64
+    stripe_height = size // 4
+    rows = (np.arange(size) // stripe_height) % 2
+    red = np.array([255, 0, 0], dtype=np.uint8)
+    white = np.array([255, 255, 255], dtype=np.uint8)
+    arr = np.where(rows[:, None, None] == 0, red, white)
+    return np.broadcast_to(arr, (size, size, 3))
+
+def _coin_kernel():
+    """Gold disc with a radial gradient, transparent outside the circle"""
+    size = 128
+    center = size // 2
+    y, x = np.ogrid[:size, :size]
+    dist = np.hypot(x - center, y - center)
+    mask = dist < center
+
+    intensity = (200 - dist / center * 100).clip(0, 255).astype(np.uint8)
+    rgba = np.zeros((size, size, 4), dtype=np.uint8)
+    rgba[..., 0] = 255
+    rgba[..., 1] = 215
+    rgba[..., 2] = intensity
+    rgba[..., 3] = mask * 255
+    rgba[~mask] = 0
+    return rgba
+
+def _car_kernel():
+    """Neutral bright car body with a noise gradient, transparent outside
+    the body - per-car colors come from tinting via entity.color, so one
+    texture serves every car"""
+    size = 64
+    n = _cached_noise_grid(size, scale=50)
+
+    yi, xi = np.ogrid[:size, :size]
+    mask = (np.abs(xi - size//2) < size//3) & (np.abs(yi - size//2) < size//4)
+    gray = np.clip(200 + n * 50, 0, 255).astype(np.uint8)
+    rgba = np.zeros((size, size, 4), dtype=np.uint8)
+    rgba[..., :3] = gray[..., None]
+    rgba[..., 3] = mask * 255
+    rgba[~mask] = 0
+    return rgba
+
+# One kernel per texture kind, each returning a uint8 image array; future
+# kernel-level optimizations only need to be applied here
+_KERNELS = {
+    'ground': _ground_kernel,
+    'wall': _wall_kernel,
+    'coin': _coin_kernel,
+    'car': _car_kernel,
+}
+
+class EntityGroup:
+    """A list of entities plus a packed float32 position array (SoA layout)
+    so the collision broad phase is a single vectorized distance test
+    instead of one Panda3D intersects() call per entity"""
+    def __init__(self, capacity=64):
+        self.entities = []
+        self.positions = np.empty((capacity, 3), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def add(self, entity):
+        n = len(self.entities)
+        if n == len(self.positions):
+            # Grow by doubling to amortize reallocation
+            grown = np.empty((n * 2, 3), dtype=np.float32)
+            grown[:n] = self.positions
+            self.positions = grown
+        self.positions[n] = entity.position
+        self.entities.append(entity)
+
+    def extend(self, entities):
+        for entity in entities:
+            self.add(entity)
+
+    def remove(self, entity):
+        """Swap-remove so the packed array stays contiguous"""
+        i = self.entities.index(entity)
+        last = len(self.entities) - 1
+        self.entities[i] = self.entities[last]
+        self.positions[i] = self.positions[last]
+        self.entities.pop()
+
+    def near(self, position, radius):
+        """Entities within radius of position (coarse pass, callers still
+        do a precise intersects() on the candidates)"""
+        n = len(self.entities)
+        if not n:
+            return []
+        d2 = ((self.positions[:n] - np.asarray(position, dtype=np.float32)) ** 2).sum(axis=1)
+        return [self.entities[i] for i in np.flatnonzero(d2 < radius * radius)]
+
+    def shift_z(self, offset):
+        """Keep the packed array in sync when entity z coordinates shift"""
+        self.positions[:len(self.entities), 2] -= offset
 
 class Car(Entity):
     def __init__(self, position=(0,0,0), color=color.red, is_player=False, texture=None):
@@ -19,8 +246,8 @@ class Car(Entity):
         self.position = position
         if texture:
             self.texture = texture
-        else:
-            self.color = color
+        # Color tints the neutral texture (or is the flat body color)
+        self.color = color
         self.collider = "box"
         self.speed = 0
         self.max_speed = 20
@@ -36,25 +263,27 @@ class Car(Entity):
             camera.rotation_x = 20
             
     def update(self):
+        # Hoist the per-frame invariants out of the branches
+        dt = time.dt
         if self.is_player:
             # Player controls
             if held_keys['w'] or held_keys['arrow_up']:
-                self.speed = lerp(self.speed, self.max_speed, time.dt)
+                self.speed = lerp(self.speed, self.max_speed, dt)
             elif held_keys['s'] or held_keys['arrow_down']:
-                self.speed = lerp(self.speed, -self.max_speed/2, time.dt)
+                self.speed = lerp(self.speed, -self.max_speed/2, dt)
             else:
-                self.speed = lerp(self.speed, 0, time.dt * 3)
+                self.speed = lerp(self.speed, 0, dt * 3)
                 
             if held_keys['a'] or held_keys['arrow_left']:
-                self.rotation_y -= self.rotation_speed * time.dt
+                self.rotation_y -= self.rotation_speed * dt
             if held_keys['d'] or held_keys['arrow_right']:
-                self.rotation_y += self.rotation_speed * time.dt
+                self.rotation_y += self.rotation_speed * dt
                 
-            self.position += self.forward * self.speed * time.dt
+            self.position += self.forward * self.speed * dt
         else:
             # AI behavior - simple path following
             if self.z < 20:
-                self.position += self.forward * self.max_speed * 0.8 * time.dt
+                self.position += self.forward * self.max_speed * 0.8 * dt
                 # Random steering
                 if random.random() < 0.1:
                     self.rotation_y += random.uniform(-10, 10)
@@ -87,14 +316,13 @@ class Leaderboard:
             
     def add_score(self, name, level, coins, score):
         """Add new score to leaderboard"""
-        self.scores.append({
+        # Insert into the already-sorted list and keep top 10
+        bisect.insort(self.scores, {
             'name': name,
             'level': level,
             'coins': coins,
             'score': score
-        })
-        # Sort and keep top 10
-        self.scores.sort(key=lambda x: x['score'], reverse=True)
+        }, key=lambda x: -x['score'])
         self.scores = self.scores[:10]
         self.save()
 
@@ -123,122 +351,46 @@ class CarRacingGame(Entity):
         
         # Initialize textures to None
         self.textures = None
+        # Texture quality, set per difficulty ("low" skips all generation)
+        self.texture_quality = "high"
         
         # Setup scene
         self.setup_title_screen()
         
+    # Generated textures memoized in memory by (kind, seed, params) -
+    # nothing ever hits the disk
+    _texture_cache = {}
+
+    def _gen_texture(self, kind, seed=None, **params):
+        """Return the texture for (kind, params), running the numpy kernel
+        and memoizing the result in memory on first use. The kernels are
+        seed-independent, so seed is accepted for signature compatibility
+        but identical output is shared across seeds and games"""
+        key = (kind, tuple(sorted(params.items())))
+        if key not in self._texture_cache:
+            arr = np.ascontiguousarray(_KERNELS[kind](**params))
+            mode = 'RGBA' if arr.shape[2] == 4 else 'RGB'
+            # Contiguous buffer lets fromarray use PIL's zero-copy path,
+            # and Ursina's Texture accepts the PIL image directly
+            self._texture_cache[key] = Texture(Image.fromarray(arr, mode))
+        return self._texture_cache[key]
+
     def generate_ground_texture(self, seed=None):
-        """Generate procedural asphalt texture using Pillow"""
-        from PIL import Image as PILImage
-        size = 512
-        img = PILImage.new('RGB', (size, size))
-        pixels = img.load()
-        
-        # Use seed for reproducibility
-        if seed is None:
-            seed = random.randint(0, 1000000)
-        random.seed(seed)
-        
-        for y in range(size):
-            for x in range(size):
-                # Generate noise pattern
-                n = noise.pnoise2(x/100, y/100, octaves=4, persistence=0.5)
-                # Dark gray with noise variation
-                gray = 50 + int(n * 30)
-                # Set pixel color
-                pixels[x, y] = (gray, gray, gray)
-        
-        # Save texture
-        filename = f"assets/ground_texture_{seed}.png"
-        img.save(filename)
-        return Texture(filename)
-    
+        """Generate procedural asphalt texture"""
+        return self._gen_texture("ground", seed)
+
     def generate_wall_texture(self, seed=None):
-        """Generate wall texture with red-white pattern using Pillow"""
-        from PIL import Image as PILImage
-        size = 256
-        img = PILImage.new('RGB', (size, size))
-        pixels = img.load()
-        
-        # Use seed for reproducibility
-        if seed is None:
-            seed = random.randint(0, 1000000)
-        random.seed(seed)
-        
-        stripe_height = 20
-        for y in range(size):
-            for x in range(size):
-                # Red and white stripes
-                if (y // stripe_height) % 2 == 0:
-                    pixels[x, y] = (255, 0, 0)  # Red
-                else:
-                    pixels[x, y] = (255, 255, 255)  # White
-        
-        # Save texture
-        filename = f"assets/wall_texture_{seed}.png"
-        img.save(filename)
-        return Texture(filename)
-    
+        """Generate wall texture with red-white pattern"""
+        return self._gen_texture("wall", seed)
+
     def generate_coin_texture(self, seed=None):
-        """Generate shiny coin texture using Pillow"""
-        from PIL import Image as PILImage
-        size = 128
-        img = PILImage.new('RGBA', (size, size))
-        pixels = img.load()
-        center = size // 2
-        
-        # Use seed for reproducibility
-        if seed is None:
-            seed = random.randint(0, 1000000)
-        random.seed(seed)
-        
-        for y in range(size):
-            for x in range(size):
-                dist = math.sqrt((x-center)**2 + (y-center)**2)
-                # Create circular coin
-                if dist < center:
-                    # Gold color with gradient
-                    intensity = 200 - int(dist/center * 100)
-                    pixels[x, y] = (255, 215, intensity, 255)
-                else:
-                    pixels[x, y] = (0, 0, 0, 0)  # Transparent
-        
-        # Save texture
-        filename = f"assets/coin_texture_{seed}.png"
-        img.save(filename)
-        return Texture(filename)
-    
-    def generate_car_texture(self, color, seed=None):
-        """Generate car texture with given color"""
-        from PIL import Image as PILImage
-        size = 128
-        img = PILImage.new('RGBA', (size, size))
-        pixels = img.load()
-        
-        # Use seed for reproducibility
-        if seed is None:
-            seed = random.randint(0, 1000000)
-        random.seed(seed)
-        
-        # Create car body with gradient
-        for y in range(size):
-            for x in range(size):
-                # Create oval shape
-                if abs(x - size//2) < size//3 and abs(y - size//2) < size//4:
-                    # Add gradient effect
-                    intensity = 150 + int(noise.pnoise2(x/50, y/50) * 50)
-                    r = min(255, color[0] + intensity)
-                    g = min(255, color[1] + intensity)
-                    b = min(255, color[2] + intensity)
-                    pixels[x, y] = (r, g, b, 255)
-                else:
-                    pixels[x, y] = (0, 0, 0, 0)  # Transparent
-        
-        # Save texture
-        filename = f"assets/car_texture_{seed}.png"
-        img.save(filename)
-        return Texture(filename)
-    
+        """Generate shiny coin texture"""
+        return self._gen_texture("coin", seed)
+
+    def generate_car_texture(self, seed=None):
+        """Generate the neutral car texture (cars are colored by tint)"""
+        return self._gen_texture("car", seed)
+
     def setup_title_screen(self):
         """Create title screen UI with save/load options"""
         self.title_entity = Entity(parent=camera.ui)
@@ -303,6 +455,10 @@ class CarRacingGame(Entity):
             self.ai_speed_factor = 0.9
         else:  # hard
             self.ai_speed_factor = 1.2
+
+        # Easy mode trades procedural textures for flat colors, which
+        # skips the texture generation cost at game start entirely
+        self.texture_quality = "low" if difficulty == "easy" else "high"
         
         # Initialize terrain bounds
         self.min_generated_z = -50
@@ -318,19 +474,26 @@ class CarRacingGame(Entity):
         self.score = 0
         
         if not load_save:
-            # Generate new world with random seed
+            # Generate new world with random seed; keep a dedicated RNG for
+            # world placement so it isn't perturbed by other random use
             self.world_seed = random.randint(0, 1000000)
-            random.seed(self.world_seed)
+            self._rng = random.Random(self.world_seed)
             
-            # Generate textures
-            self.textures = {
-                "ground": self.generate_ground_texture(self.world_seed),
-                "wall": self.generate_wall_texture(self.world_seed),
-                "coin": self.generate_coin_texture(self.world_seed)
-            }
+            # Generate textures (low quality uses flat colors instead)
+            if self.texture_quality == "high":
+                self.textures = {
+                    "ground": self.generate_ground_texture(self.world_seed),
+                    "wall": self.generate_wall_texture(self.world_seed),
+                    "coin": self.generate_coin_texture(self.world_seed),
+                    "car": self.generate_car_texture(self.world_seed)
+                }
+            else:
+                self.textures = None
             
             # Initialize coin_entities before creating track
             self.coin_entities = []
+            self.coin_group = EntityGroup()
+            self.active_coins = set()
             
             # Create track
             self.create_track()
@@ -339,11 +502,11 @@ class CarRacingGame(Entity):
             self.ai_cars = []
             self.spawn_ai_cars()
             
-            # Create player car
+            # Create player car (red tint over the shared texture)
             self.player = Car(
                 position=(0, 0, 0),
                 is_player=True,
-                texture=self.generate_car_texture((255, 0, 0), self.world_seed)
+                texture=self.textures["car"] if self.textures else None
             )
         else:
             # Load saved game
@@ -362,14 +525,29 @@ class CarRacingGame(Entity):
             self.player.camera_pivot.position = (0, 5, -10)
             camera.rotation_x = 20
         
+    # Coarse broad-phase radius around the player, generous enough to
+    # cover every entity whose box could actually intersect the car
+    BROAD_PHASE_RADIUS = 6
+
     def create_track(self):
         """Generate procedural track with textures"""
-        # Ground with generated texture
-        Entity(model="plane", scale=100, texture=self.textures["ground"], texture_scale=(10,10))
-        
+        # Ground with generated texture, or flat asphalt gray in low quality
+        if self.textures:
+            Entity(model="plane", scale=100, texture=self.textures["ground"], texture_scale=(10,10))
+        else:
+            Entity(model="plane", scale=100, color=color.rgb(50, 50, 50))
+
         # Create lists to store walls and obstacles
         self.walls = []
         self.obstacles = []
+        # Occupied wall slots as quantized z keys, so the de-dup check is a
+        # hash lookup instead of a scan over every existing wall
+        self._wall_z_set = set()
+
+        # Packed position arrays so collision checks only touch entities
+        # near the player instead of the whole world
+        self.wall_group = EntityGroup()
+        self.obstacle_group = EntityGroup()
         
         # Initialize the generated z boundaries
         self.min_generated_z = -50
@@ -380,44 +558,53 @@ class CarRacingGame(Entity):
         
     def generate_track_segment(self, start_z, end_z):
         """Generate a segment of track between start_z and end_z"""
+        # Entity styling for both texture quality modes
+        if self.textures:
+            wall_style = {'texture': self.textures["wall"]}
+            coin_style = {'texture': self.textures["coin"]}
+        else:
+            wall_style = {'color': color.rgb(180, 20, 20)}
+            coin_style = {'color': color.gold}
         try:
-            # Generate walls
+            # Collect the unoccupied wall slots first
             step = 2
+            zs = []
             z = start_z
             while z <= end_z:
-                # Only generate walls if not already existing at this position
-                if not any(abs(wall.z - z) < 0.1 for wall in self.walls):
-                    wall_left = Entity(model="cube", position=(15,0.5,z), scale=(0.5,1,2),
-                                      texture=self.textures["wall"])
-                    wall_left.collider = "box"
-                    self.walls.append(wall_left)
-                    
-                    wall_right = Entity(model="cube", position=(-15,0.5,z), scale=(0.5,1,2),
-                                       texture=self.textures["wall"])
-                    wall_right.collider = "box"
-                    self.walls.append(wall_right)
+                key = round(z * 10)
+                if key not in self._wall_z_set:
+                    self._wall_z_set.add(key)
+                    zs.append(z)
                 z += step
+
+            # Batch-create the walls and extend the lists in one go
+            new_walls = [Entity(model="cube", position=(x,0.5,z), scale=(0.5,1,2),
+                                collider="box", **wall_style)
+                         for z in zs for x in (15, -15)]
+            self.walls.extend(new_walls)
+            self.wall_group.extend(new_walls)
         except Exception as e:
             print(f"Error generating track segment: {e}")
         
         # Generate obstacles
         num_obstacles = max(5, int((end_z - start_z) / 10))
-        for i in range(num_obstacles):
-            obstacle = Entity(model="cube",
-                             position=(random.uniform(-12,12), 1, random.uniform(start_z, end_z)),
-                             scale=(2,2,2), texture=self.textures["wall"])
-            obstacle.collider = "box"
-            self.obstacles.append(obstacle)
+        new_obstacles = [Entity(model="cube",
+                                position=(self._rng.uniform(-12,12), 1, self._rng.uniform(start_z, end_z)),
+                                scale=(2,2,2), collider="box", **wall_style)
+                         for i in range(num_obstacles)]
+        self.obstacles.extend(new_obstacles)
+        self.obstacle_group.extend(new_obstacles)
         
         # Generate coins in this segment
         num_coins = max(10, int((end_z - start_z) / 5))
-        for i in range(num_coins):
-            coin = Entity(model="sphere",
-                         position=(random.uniform(-12,12), 1, random.uniform(start_z, end_z)),
-                         scale=0.8, texture=self.textures["coin"])
-            coin.collider = "sphere"
-            self.coin_entities.append(coin)
-            self.total_coins += 1
+        new_coins = [Entity(model="sphere",
+                            position=(self._rng.uniform(-12,12), 1, self._rng.uniform(start_z, end_z)),
+                            scale=0.8, collider="sphere", **coin_style)
+                     for i in range(num_coins)]
+        self.coin_entities.extend(new_coins)
+        self.coin_group.extend(new_coins)
+        self.active_coins.update(new_coins)
+        self.total_coins += len(new_coins)
     
     def spawn_coins(self):
         """Generate coins around the track (now handled in generate_track_segment)"""
@@ -426,14 +613,15 @@ class CarRacingGame(Entity):
     def spawn_ai_cars(self):
         """Create AI opponent cars with generated textures"""
         colors = [(0, 0, 255), (0, 255, 0), (255, 255, 0), (255, 165, 0)]  # RGB values
-        for i in range(4):
-            car = Car(
-                position=(random.uniform(-10,10), 0, random.uniform(-20,-40)),
-                is_player=False,
-                texture=self.generate_car_texture(colors[i % len(colors)], self.world_seed + i)
-            )
+        new_cars = [Car(
+            position=(self._rng.uniform(-10,10), 0, self._rng.uniform(-20,-40)),
+            is_player=False,
+            color=color.rgb(*colors[i % len(colors)]),
+            texture=self.textures["car"] if self.textures else None
+        ) for i in range(4)]
+        for car in new_cars:
             car.max_speed *= self.ai_speed_factor
-            self.ai_cars.append(car)
+        self.ai_cars.extend(new_cars)
     
     def create_dashboard(self):
         """Create in-game UI dashboard"""
@@ -473,7 +661,9 @@ class CarRacingGame(Entity):
     def create_minimap(self):
         """Create minimap display"""
         self.minimap = Entity(parent=camera.ui, model="quad", scale=(0.4, 0.4),
-                             position=(0.7, 0.4), texture=self.textures["ground"])
+                             position=(0.7, 0.4),
+                             texture=self.textures["ground"] if self.textures else None,
+                             color=color.white if self.textures else color.rgb(50, 50, 50))
         
         # Create a camera for the minimap
         self.minimap_camera = EditorCamera(parent=self.minimap, enabled=False)
@@ -510,6 +700,13 @@ class CarRacingGame(Entity):
     
     def collect_coin(self, coin):
         """Handle coin collection"""
+        self.coin_group.remove(coin)
+        self.active_coins.discard(coin)
+        # Swap-remove from the entity list too, mirroring the group, so the
+        # culler never sees a destroyed coin
+        i = self.coin_entities.index(coin)
+        self.coin_entities[i] = self.coin_entities[-1]
+        self.coin_entities.pop()
         destroy(coin)
         self.coins += 1
         self.score += 100 * self.level
@@ -566,7 +763,7 @@ class CarRacingGame(Entity):
                 'max_speed': self.player.max_speed,
                 'rotation_speed': self.player.rotation_speed
             },
-            'coins': [coin.position for coin in self.coin_entities if coin.enabled],
+            'coins': [tuple(coin.position) for coin in self.active_coins],
             'ai_cars': [{
                 'position': tuple(car.position),
                 'rotation': tuple(car.rotation),
@@ -582,20 +779,24 @@ class CarRacingGame(Entity):
             }
         }
         
-        with open("savegame.json", "w") as f:
-            json.dump(save_data, f)
+        with open(SAVEGAME_FILE, "wb") as f:
+            pickle.dump(save_data, f, protocol=5)
             
         print("Spiel gespeichert!")
     
     def load_game(self):
         """Load game state from save file including terrain bounds"""
-        if not os.path.exists("savegame.json"):
+        if os.path.exists(SAVEGAME_FILE):
+            with open(SAVEGAME_FILE, "rb") as f:
+                save_data = pickle.load(f)
+        elif os.path.exists("savegame.json"):
+            # Legacy save from before the switch to pickle
+            with open("savegame.json", "r") as f:
+                save_data = json.load(f)
+        else:
             print("Kein Speicherstand gefunden!")
             return
             
-        with open("savegame.json", "r") as f:
-            save_data = json.load(f)
-            
         # Clear existing game objects safely
         if hasattr(self, 'coin_entities'):
             for coin in self.coin_entities:
@@ -612,16 +813,20 @@ class CarRacingGame(Entity):
         if hasattr(self, 'player') and self.player:
             destroy(self.player)
         
-        # Set world seed
+        # Set world seed and rebuild the world-placement RNG from it
         self.world_seed = save_data['world_seed']
-        random.seed(self.world_seed)
+        self._rng = random.Random(self.world_seed)
         
-        # Recreate textures
-        self.textures = {
-            "ground": self.generate_ground_texture(self.world_seed),
-            "wall": self.generate_wall_texture(self.world_seed),
-            "coin": self.generate_coin_texture(self.world_seed)
-        }
+        # Recreate textures (low quality uses flat colors instead)
+        if self.texture_quality == "high":
+            self.textures = {
+                "ground": self.generate_ground_texture(self.world_seed),
+                "wall": self.generate_wall_texture(self.world_seed),
+                "coin": self.generate_coin_texture(self.world_seed),
+                "car": self.generate_car_texture(self.world_seed)
+            }
+        else:
+            self.textures = None
         
         # Set terrain bounds
         self.min_generated_z = save_data['min_generated_z']
@@ -631,23 +836,26 @@ class CarRacingGame(Entity):
         self.create_track()
         
         # Recreate coins
-        self.coin_entities = []
-        self.total_coins = 0
-        for coin_pos in save_data['coins']:
-            coin = Entity(model="sphere", position=coin_pos,
-                         scale=0.8, texture=self.textures["coin"])
-            coin.collider = "sphere"
-            self.coin_entities.append(coin)
-            self.total_coins += 1
+        coin_style = ({'texture': self.textures["coin"]} if self.textures
+                      else {'color': color.gold})
+        self.coin_entities = [Entity(model="sphere", position=coin_pos,
+                                     scale=0.8, collider="sphere", **coin_style)
+                              for coin_pos in save_data['coins']]
+        self.coin_group = EntityGroup()
+        self.coin_group.extend(self.coin_entities)
+        self.active_coins = set(self.coin_entities)
+        self.total_coins = len(self.coin_entities)
         
         # Recreate AI cars
         self.ai_cars = []
         colors = [(0, 0, 255), (0, 255, 0), (255, 255, 0), (255, 165, 0)]
         for i, car_data in enumerate(save_data['ai_cars']):
+            rgb = colors[i % len(colors)]
             car = Car(
                 position=car_data['position'],
                 is_player=False,
-                texture=self.generate_car_texture(colors[i % len(colors)], self.world_seed + i)
+                color=color.rgb(*rgb),
+                texture=self.textures["car"] if self.textures else None
             )
             car.max_speed = car_data['max_speed']
             car.speed = car_data['speed']
@@ -659,7 +867,7 @@ class CarRacingGame(Entity):
         self.player = Car(
             position=player_data['position'],
             is_player=True,
-            texture=self.generate_car_texture((255, 0, 0), self.world_seed)
+            texture=self.textures["car"] if self.textures else None
         )
         self.player.speed = player_data['speed']
         self.player.max_speed = player_data['max_speed']
@@ -712,16 +920,24 @@ class CarRacingGame(Entity):
             # Update minimap
             self.update_minimap()
             
-            # Check coin collisions
-            for coin in self.coin_entities:
+            # Per-frame invariants: compute the player's frame displacement
+            # once instead of rebuilding the Vec3 chain per collision
+            dt = time.dt
+            player_velocity = self.player.forward * self.player.speed * dt
+
+            # Check coin collisions - vectorized distance test first, then
+            # precise intersects() only on the few nearby candidates
+            player_pos = self.player.position
+            for coin in self.coin_group.near(player_pos, self.BROAD_PHASE_RADIUS):
                 if hasattr(coin, 'enabled') and coin.enabled and coin.intersects(self.player).hit:
                     self.collect_coin(coin)
             
             # Check wall and obstacle collisions
-            for entity in self.walls + self.obstacles:
+            for entity in (self.wall_group.near(player_pos, self.BROAD_PHASE_RADIUS)
+                           + self.obstacle_group.near(player_pos, self.BROAD_PHASE_RADIUS)):
                 if self.player.intersects(entity).hit:
                     # Bounce back on collision
-                    self.player.position -= self.player.forward * self.player.speed * time.dt * 2
+                    self.player.position -= player_velocity * 2
                     self.player.speed *= -0.5
                     self.score = max(0, self.score - 10)
             
@@ -738,7 +954,7 @@ class CarRacingGame(Entity):
                 
                 # Auto-save every 60 seconds (safer implementation)
                 if hasattr(self, 'auto_save_timer'):
-                    self.auto_save_timer += time.dt
+                    self.auto_save_timer += dt
                     if self.auto_save_timer >= 60:
                         self.save_game()
                         print("Spiel automatisch gespeichert!")
@@ -748,6 +964,45 @@ class CarRacingGame(Entity):
         except Exception as e:
             print(f"Fehler im Spielupdate: {e}")
 
+    # Entities farther than this from the player get destroyed
+    CULL_DISTANCE = 200
+
+    def _cull_distant_entities(self):
+        """Destroy world entities far from the player so the collision
+        lists and memory stay bounded on infinite terrain"""
+        pz = self.player.z
+
+        def cull(entities, group):
+            kept = []
+            for entity in entities:
+                if abs(entity.z - pz) > self.CULL_DISTANCE:
+                    group.remove(entity)
+                    destroy(entity)
+                else:
+                    kept.append(entity)
+            return kept
+
+        self.walls = cull(self.walls, self.wall_group)
+        self.obstacles = cull(self.obstacles, self.obstacle_group)
+        kept_coins = cull(self.coin_entities, self.coin_group)
+        culled_coins = len(self.coin_entities) - len(kept_coins)
+        self.coin_entities = kept_coins
+        self.active_coins.intersection_update(kept_coins)
+        if culled_coins:
+            # Culled coins are gone for good, so stop counting them toward
+            # the level-up target
+            self.total_coins -= culled_coins
+            if hasattr(self, 'coin_text'):
+                self.coin_text.text = f"Münzen: {self.coins}/{self.total_coins}"
+
+        # Free the culled walls' slots so they can regenerate
+        self._wall_z_set = {round(wall.z * 10) for wall in self.walls}
+
+        # Pull the generated bounds back inside the kept window so culled
+        # stretches regenerate if the player returns
+        self.min_generated_z = max(self.min_generated_z, pz - self.CULL_DISTANCE)
+        self.max_generated_z = min(self.max_generated_z, pz + self.CULL_DISTANCE)
+
     def generate_more_terrain(self):
         """Generate new terrain segments as player moves"""
         # Extend terrain in both directions
@@ -760,7 +1015,10 @@ class CarRacingGame(Entity):
             new_max = self.min_generated_z
             self.min_generated_z -= 50
             self.generate_track_segment(self.min_generated_z, new_max)
-            
+
+        # Reap entities the player has left far behind
+        self._cull_distant_entities()
+
         # Reset player position to center to avoid floating point precision issues
         if abs(self.player.z) > 1000:
             offset = self.player.z
@@ -774,6 +1032,12 @@ class CarRacingGame(Entity):
                 coin.z -= offset
             for car in self.ai_cars:
                 car.z -= offset
+            # Keep the packed position arrays in sync with the shift
+            self.wall_group.shift_z(offset)
+            self.obstacle_group.shift_z(offset)
+            self.coin_group.shift_z(offset)
+            # Wall slot keys are derived from z, so recompute them
+            self._wall_z_set = {round(wall.z * 10) for wall in self.walls}
 
 # Start the game
 if __name__ == "__main__":